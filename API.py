@@ -15,16 +15,31 @@ Example
 
 from __future__ import annotations
 
+import asyncio
 import datetime
+import hashlib
+import io
 import json
 import logging
 import os
 import re
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from zoneinfo import ZoneInfo  # Python 3.9+
-import tzlocal                 # pip install tzlocal
-import google.generativeai as genai
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+
+try:                           # pip install orjson (optional, faster)
+    import orjson
+
+    _loads = orjson.loads
+    _JSON_ERRORS: tuple = (orjson.JSONDecodeError, json.JSONDecodeError)
+except ImportError:
+    _loads = json.loads
+    _JSON_ERRORS = (json.JSONDecodeError,)
 
 # --------------------------------------------------------------------------- #
 # Logging                                                                     #
@@ -35,6 +50,254 @@ logging.basicConfig(
     format="%(asctime)s %(levelname)s [%(name)s] %(message)s"
 )
 
+# --------------------------------------------------------------------------- #
+# Prompt                                                                      #
+# --------------------------------------------------------------------------- #
+_PROMPT_TMPL = """Extract every calendar event mentioned in the following text and return only a single JSON object like this:
+{{
+  "events": [
+    {{
+      "summary": "Team Meeting",
+      "start_date": "2025-03-10",
+      "end_date": "2025-03-10",
+      "start_time": "10:00",
+      "end_time":   "11:00",
+      "timezone":   "Australia/Adelaide",
+      "location":   "Room 101",
+      "description":"Quarterly planning session \\n organiser: ACME Corp \\n source: ACME webpage",
+      "tz_conversion": "Sydney 10:30‑11:30 → Adelaide 10:00‑11:00",
+      "recurrence": {{
+        "frequency": "daily",
+        "interval":  1,
+        "count":     5
+      }}
+    }}
+  ]
+}}
+
+Rules
+-----
+1. If the same event is repeated in the text, merge the duplicates.
+2. Convert every time to the correct time‑zone which is {location}.
+3. Output MUST be valid JSON with no extra text. If a timezone conversion is
+   needed, fill the “tz_conversion” field with the before‑and‑after information;
+   otherwise, leave this field empty.
+4. All field values must be written in {language}.
+5. The description field should include (when available): event summary(should less than 5 setence),
+   organiser, and the source from where the event was extracted (e.g. ACME webpage).
+6. The times shown in event details are usually given in the event’s local time zone. If that differs from the user’s current time zone, they’ll need to convert the times accordingly.
+
+(Current date: {date})
+
+Here is the text:
+"""
+
+
+@lru_cache(maxsize=8)
+def _build_prompt(date_str: str, location: str, language: str) -> str:
+    """Full prompt; only rebuilt when the date, location or language changes."""
+    return _PROMPT_TMPL.format(date=date_str, location=location, language=language)
+
+
+# --------------------------------------------------------------------------- #
+# Response schema                                                             #
+# --------------------------------------------------------------------------- #
+def _as_text(value: Any) -> Optional[str]:
+    """`value` as a string if it is a scalar, else None (blanked out)."""
+    if isinstance(value, (str, int, float)):
+        return str(value)
+    return None
+
+
+class Recurrence(BaseModel):
+    """`recurrence` block of an event (see the prompt example)."""
+
+    model_config = ConfigDict(extra="allow")
+
+    frequency: Optional[str] = "none"
+    interval: Optional[int] = 1
+    count: Optional[int] = None
+
+    @field_validator("frequency", mode="before")
+    @classmethod
+    def _frequency_text(cls, value: Any) -> Optional[str]:
+        return _as_text(value)
+
+    @field_validator("interval", "count", mode="before")
+    @classmethod
+    def _int_or_blank(cls, value: Any) -> Optional[int]:
+        # "", None, "n/a", 2.5 ... all mean "not given"; the ICS writer
+        # falls back to INTERVAL=1 and no COUNT for those.
+        if isinstance(value, int):
+            return value
+        if isinstance(value, str) and value.strip().isdecimal():
+            return int(value)
+        return None
+
+
+class Event(BaseModel):
+    """
+    One extracted event; only `summary` and `start_date` are required.
+
+    The schema is deliberately as loose as `generate_ics`: anything the ICS
+    writer copes with (numbers for dates/times, ``"recurrence": "none"``,
+    ``"count": ""`` ...) is accepted rather than triggering a paid retry.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    summary: str
+    start_date: str
+    end_date: Optional[str] = None
+    start_time: Optional[str] = None
+    end_time: Optional[str] = None
+    timezone: Optional[str] = None
+    location: Optional[str] = None
+    description: Optional[str] = None
+    tz_conversion: Optional[str] = None
+    recurrence: Optional[Recurrence] = None
+
+    @field_validator("summary", "start_date", mode="before")
+    @classmethod
+    def _required_text(cls, value: Any) -> Any:
+        # null / nested values are left to fail: the event is unusable then.
+        if isinstance(value, (int, float)):
+            return str(value)
+        return value
+
+    @field_validator(
+        "end_date", "start_time", "end_time", "timezone",
+        "location", "description", "tz_conversion",
+        mode="before",
+    )
+    @classmethod
+    def _optional_text(cls, value: Any) -> Optional[str]:
+        return _as_text(value)
+
+    @field_validator("recurrence", mode="before")
+    @classmethod
+    def _recurrence_dict(cls, value: Any) -> Any:
+        return value if isinstance(value, dict) else None
+
+
+class EventsDoc(BaseModel):
+    """Top‑level JSON object Gemini is asked to return."""
+
+    model_config = ConfigDict(extra="allow")
+
+    events: List[Event]
+
+
+_MAX_ATTEMPTS = 3  # first request + 2 retries with validator feedback
+
+# --------------------------------------------------------------------------- #
+# JSON extraction                                                             #
+# --------------------------------------------------------------------------- #
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+class _JSONScanner:
+    """
+    Incremental locator for the first balanced ``{...}`` block.
+
+    Feed the reply chunk by chunk; `feed` returns the JSON text as soon as
+    the closing brace arrives. Brace depth, string and escape state carry
+    over between chunks, and braces inside double‑quoted strings (honouring
+    backslash escapes) are ignored, so trailing prose is never swallowed.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[str] = []
+        self._offset = 0       # characters fed before the current chunk
+        self._start = -1       # absolute index of the opening brace
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> Optional[str]:
+        """Consume `chunk`; return the first complete object once found."""
+        self._chunks.append(chunk)
+        pos = 0
+        if self._start < 0:
+            pos = chunk.find("{")
+            if pos < 0:
+                self._offset += len(chunk)
+                return None
+            self._start = self._offset + pos
+
+        depth, in_string, escape = self._depth, self._in_string, self._escape
+        for i in range(pos, len(chunk)):
+            ch = chunk[i]
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    end = self._offset + i + 1
+                    return self.text[self._start : end]
+
+        self._depth, self._in_string, self._escape = depth, in_string, escape
+        self._offset += len(chunk)
+        return None
+
+
+def _find_json(text: str) -> Optional[str]:
+    """Return the first balanced ``{...}`` block in `text`, or None."""
+    found = _JSONScanner().feed(text)
+    if found is not None:
+        return found
+
+    # Unbalanced – fall back to the old greedy match.
+    match = _JSON_RE.search(text)
+    return match.group(0) if match else None
+
+
+def _reply_error(reply_text: str) -> Optional[str]:
+    """Why `reply_text` is not a usable `EventsDoc` reply, or None if it is."""
+    json_str = _find_json(reply_text)
+    if json_str is None:
+        return "the reply did not contain a JSON object"
+    try:
+        EventsDoc.model_validate(_loads(json_str))
+    except _JSON_ERRORS as exc:
+        return f"the JSON could not be decoded: {exc}"
+    except ValidationError as exc:
+        return str(exc)
+    return None
+
+
+# --------------------------------------------------------------------------- #
+# Batch mode                                                                  #
+# --------------------------------------------------------------------------- #
+_BATCH_POLL_MIN = 5.0    # seconds before the first status check
+_BATCH_POLL_MAX = 60.0   # upper bound for the exponential backoff
+_BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+# --------------------------------------------------------------------------- #
+# Response cache                                                              #
+# --------------------------------------------------------------------------- #
+# Bump whenever the prompt text changes so stale replies are not reused.
+PROMPT_VERSION = b"1"
+
 # --------------------------------------------------------------------------- #
 # API wrapper                                                                 #
 # --------------------------------------------------------------------------- #
@@ -52,6 +315,10 @@ class API:
         Language for all JSON values (e.g. "English", "Chinese").
     default_model : str, default "gemini-2.5-flash"
         Gemini model name used by default.
+    cache_dir : Path | None, default None
+        Directory for an on‑disk cache of `gemini_calendar` replies, keyed by
+        model, prompt version, date, language, location and message text.
+        Disabled when None.
 
     Attributes
     ----------
@@ -71,68 +338,49 @@ class API:
         location: str = "Australia/Adelaide",
         language: str = "English",
         default_model: str = "gemini-2.5-flash",
+        cache_dir: Optional[Path] = None,
     ) -> None:
         self.api_key: str = gemini_api_key.strip()
         if not self.api_key:
             raise ValueError("Gemini API key must not be empty.")
 
+        # Imported here rather than at module level: the SDK pulls in gRPC,
+        # protobuf and auth libraries, which slows down every import of
+        # this module even when no request is made.
+        import google.generativeai as genai  # pip install google-generativeai
+
+        self._genai = genai
         genai.configure(api_key=self.api_key)
 
         self.location: str = location
         self.language: str = language
         self.default_model: str = default_model
 
+        # One GenerativeModel shared by every request.
+        self._model = genai.GenerativeModel(self.default_model)
+        self._model_name: str = self.default_model
+
         # Prompt header is generated dynamically in `generate_prompt()`
         # because it includes today's date.
+
+        # On‑disk response cache (optional) --------------------------------
+        self.cache_dir: Optional[Path] = Path(cache_dir) if cache_dir else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
     # --------------------------------------------------------------------- #
     # Public methods                                                        #
     # --------------------------------------------------------------------- #
     def generate_prompt(self) -> str:
         """Build the system prompt used for event extraction."""
-        current_date = datetime.date.today().strftime("%Y-%m-%d")
-        return f"""Extract every calendar event mentioned in the following text and return only a single JSON object like this:
-{{
-  "events": [
-    {{
-      "summary": "Team Meeting",
-      "start_date": "2025-03-10",
-      "end_date": "2025-03-10",
-      "start_time": "10:00",
-      "end_time":   "11:00",
-      "timezone":   "Australia/Adelaide",
-      "location":   "Room 101",
-      "description":"Quarterly planning session \\n organiser: ACME Corp \\n source: ACME webpage",
-      "tz_conversion": "Sydney 10:30‑11:30 → Adelaide 10:00‑11:00",
-      "recurrence": {{
-        "frequency": "daily",
-        "interval":  1,
-        "count":     5
-      }}
-    }}
-  ]
-}}
-
-Rules
------
-1. If the same event is repeated in the text, merge the duplicates.
-2. Convert every time to the correct time‑zone which is {self.location}.
-3. Output MUST be valid JSON with no extra text. If a timezone conversion is
-   needed, fill the “tz_conversion” field with the before‑and‑after information;
-   otherwise, leave this field empty.
-4. All field values must be written in {self.language}.
-5. The description field should include (when available): event summary(should less than 5 setence),
-   organiser, and the source from where the event was extracted (e.g. ACME webpage).
-6. The times shown in event details are usually given in the event’s local time zone. If that differs from the user’s current time zone, they’ll need to convert the times accordingly.
-
-(Current date: {current_date})
-
-Here is the text:
-"""
+        return _build_prompt(
+            datetime.date.today().isoformat(), self.location, self.language
+        )
 
     def gemini_normal(self, message) -> str:
         """Send `message` to Gemini and return raw text reply."""
         history=[]
-        model = genai.GenerativeModel(self.default_model)
+        model = self._generative_model()
         new_message = {"role": "user", "parts": [message]}
         history.append(new_message)
         response = model.generate_content(history)
@@ -140,14 +388,119 @@ Here is the text:
 
     def gemini_calendar(self, message: str) -> str:
         """Build prompt + user text, then call Gemini for calendar extraction."""
-        prompt = self.generate_prompt()
-        full_message = f"{prompt}\n{message}"
         print(
             "Generate calendar event ....\n"
             f"timezone: {self.location},\n"
             f"language: {self.language},\n"
         )
-        return self.gemini_normal(full_message)
+        key = self._response_cache_key(message)
+        cached = self._response_cache_get(key)
+        if cached is not None:
+            logger.info("Response cache hit (%s).", key[:12])
+            return cached
+
+        reply = self._calendar_reply(message)
+
+        # Only replies that pass the schema check are worth replaying.
+        if self.cache_dir is not None and _reply_error(reply) is None:
+            self._response_cache_put(key, reply)
+        return reply
+
+    def gemini_batch(self, messages: List[str]) -> List[str]:
+        """
+        Send every item of `messages` through Gemini Batch Mode.
+
+        The requests are submitted as one asynchronous batch job (billed at
+        the discounted batch rate) and this call blocks until the job has
+        finished. Use `gemini_normal` for interactive, single requests.
+
+        Returns
+        -------
+        list[str]
+            Raw text replies in the same order as `messages`; an empty
+            string marks a request that failed inside the batch.
+        """
+        from google import genai as genai_batch  # pip install google-genai
+        from google.genai import types
+
+        if not messages:
+            return []
+
+        client = genai_batch.Client(api_key=self.api_key)
+
+        # -------- JSONL payload, one request per line ---------------------
+        payload = io.BytesIO()
+        for i, message in enumerate(messages):
+            line = {
+                "key": f"req_{i}",
+                "request": {"contents": [{"parts": [{"text": message}]}]},
+            }
+            payload.write(json.dumps(line, ensure_ascii=False).encode("utf-8"))
+            payload.write(b"\n")
+        payload.seek(0)
+
+        uploaded = client.files.upload(
+            file=payload,
+            config=types.UploadFileConfig(display_name="extract", mime_type="jsonl"),
+        )
+        batch_job = client.batches.create(
+            model=self.default_model,
+            src=uploaded.name,
+            config={"display_name": "extract"},
+        )
+        logger.info("Batch job %s submitted (%d request(s)).", batch_job.name, len(messages))
+
+        # -------- poll with exponential backoff ---------------------------
+        delay = _BATCH_POLL_MIN
+        while batch_job.state.name not in _BATCH_DONE_STATES:
+            time.sleep(delay)
+            delay = min(delay * 2, _BATCH_POLL_MAX)
+            batch_job = client.batches.get(name=batch_job.name)
+
+        if batch_job.state.name != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(
+                f"Batch job {batch_job.name} ended in state {batch_job.state.name}."
+            )
+
+        # -------- collect replies by key ----------------------------------
+        replies: Dict[str, str] = {}
+        content = client.files.download(file=batch_job.dest.file_name)
+        # A bad line only loses its own reply, never the whole finished job.
+        for lineno, line in enumerate(
+            content.decode("utf-8", errors="replace").splitlines(), start=1
+        ):
+            if not line.strip():
+                continue
+            try:
+                item = _loads(line)
+            except _JSON_ERRORS as exc:
+                logger.error("Skipping malformed batch result line %d: %s", lineno, exc)
+                continue
+            if not isinstance(item, dict):
+                logger.error("Skipping malformed batch result line %d.", lineno)
+                continue
+            key = item.get("key", "")
+            if "error" in item:
+                logger.error("Batch request %s failed: %s", key, item["error"])
+                continue
+            try:
+                parts = item["response"]["candidates"][0]["content"]["parts"]
+            except (KeyError, IndexError, TypeError) as exc:
+                logger.error("Batch request %s returned no content: %s", key, exc)
+                continue
+            replies[key] = "".join(part.get("text", "") for part in parts)
+
+        return [replies.get(f"req_{i}", "") for i in range(len(messages))]
+
+    def gemini_calendar_batch(self, messages: List[str]) -> List[str]:
+        """Batch counterpart of `gemini_calendar` (see `gemini_batch`)."""
+        prompt = self.generate_prompt()
+        print(
+            f"Generate {len(messages)} calendar event request(s) in batch mode ....\n"
+            f"timezone: {self.location},\n"
+            f"language: {self.language},\n"
+        )
+        return self.gemini_batch([f"{prompt}\n{message}" for message in messages])
 
     # --------------------------------------------------------------------- #
     # Static helpers                                                        #
@@ -161,21 +514,19 @@ Here is the text:
         dict | None
             Parsed JSON if successful, otherwise None.
         """
-        json_pattern = r"\{.*\}"
-        match = re.search(json_pattern, reply_text, re.DOTALL)
-        if not match:
+        json_str = _find_json(reply_text)
+        if json_str is None:
             logger.warning("No JSON object found in Gemini reply.")
             return None
 
-        json_str = match.group(0)
         try:
-            parsed = json.loads(json_str)
+            parsed = _loads(json_str)
             logger.info(
                 "JSON parsed successfully (%d event(s) found).",
                 len(parsed.get("events", [])),
             )
             return parsed
-        except json.JSONDecodeError as exc:
+        except _JSON_ERRORS as exc:
             logger.error("JSON decoding failed: %s", exc)
             return None
 
@@ -183,17 +534,201 @@ Here is the text:
         """
         High‑level helper: ask Gemini to extract events, then parse JSON and
         optionally report any timezone conversions.
+
+        If the reply holds no decodable JSON object, or lacks `events` or an
+        event's `summary`/`start_date` (the only things `EventsDoc` insists
+        on), the bad reply and the validator's error are appended to the
+        conversation and Gemini is asked again (up to `_MAX_ATTEMPTS` calls in total). Retries
+        bypass the response cache; a corrected reply is cached for
+        `message`. After the last attempt the parsed reply is returned as
+        is, or None if it was not valid JSON.
         """
-        raw_json = self.gemini_calendar(message)
-        data = self.extract_and_parse_json(raw_json)
-
-        if data:
-            for event in data.get("events", []):
-                tz_info = event.get("tz_conversion", "")
-                if tz_info:
-                    print(
-                        f'Timezone conversion triggered: "{tz_info}" '
-                        f'in "{event.get("summary", "")}"'
-                    )
+        reply = self.gemini_calendar(message)
+        followup: List[Dict[str, Any]] = []
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            error = _reply_error(reply)
+            if error is None:
+                if attempt > 1:
+                    self._response_cache_put(self._response_cache_key(message), reply)
+                break
+
+            if attempt == _MAX_ATTEMPTS:
+                logger.error("Giving up after %d attempt(s): %s", _MAX_ATTEMPTS, error)
+                break
+
+            logger.warning("Invalid reply (attempt %d), retrying: %s", attempt, error)
+            followup += [
+                {"role": "model", "parts": [reply or "(empty reply)"]},
+                {
+                    "role": "user",
+                    "parts": [
+                        f"Your previous reply had error: {error}. "
+                        "Return valid JSON only."
+                    ],
+                },
+            ]
+            time.sleep(1.0 * attempt)
+            reply = self._calendar_reply(message, followup)
+
+        data = self.extract_and_parse_json(reply)
+        self._report_tz_conversions(data)
         return data
 
+    async def extract_events_batch(
+        self, messages: List[str], concurrency: int = 16
+    ) -> List[Dict[str, Any] | None]:
+        """
+        Run `extract_event` over `messages` concurrently.
+
+        Each message gets the full `extract_event` treatment (response
+        cache, streaming, validation + retry). The concurrency is
+        thread-based: the blocking `extract_event` calls run in a pool of
+        `concurrency` threads (so at most that many requests are in flight
+        at once) and are only awaited from the event loop; there is no
+        native async Gemini path. Results are returned in the same order as
+        `messages`.
+
+        In a notebook (or any running event loop) call it as
+        ``await api.extract_events_batch(messages)``.
+        """
+        if not messages:
+            return []
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return await asyncio.gather(
+                *(loop.run_in_executor(pool, self.extract_event, m) for m in messages)
+            )
+
+    def extract_events_many(
+        self, messages: List[str], concurrency: int = 16
+    ) -> List[Dict[str, Any] | None]:
+        """
+        Synchronous wrapper around `extract_events_batch` for scripts.
+
+        Uses `asyncio.run`, which raises RuntimeError inside a running event
+        loop; in Jupyter (e.g. ``RunFromHere.ipynb``) use
+        ``await api.extract_events_batch(messages)`` instead.
+        """
+        return asyncio.run(self.extract_events_batch(messages, concurrency))
+
+    # --------------------------------------------------------------------- #
+    # Internal helpers                                                      #
+    # --------------------------------------------------------------------- #
+    def _calendar_reply(
+        self, message: str, followup: Optional[List[Dict[str, Any]]] = None
+    ) -> str:
+        """
+        Ask Gemini to extract events from `message` (no response cache).
+
+        `followup` holds extra conversation turns after the first user turn,
+        e.g. a rejected reply and the validator's feedback.
+        """
+        prompt = self.generate_prompt()
+        full_message = f"{prompt}\n{message}"
+        contents = [{"role": "user", "parts": [full_message]}, *(followup or [])]
+        return self._stream_json_reply(self._generative_model(), contents)
+
+    @staticmethod
+    def _stream_json_reply(model, contents) -> str:
+        """
+        Stream a reply and stop as soon as the first complete JSON object
+        has arrived; returns that object's text, or the whole reply if it
+        never contains one.
+        """
+        scanner = _JSONScanner()
+        for chunk in model.generate_content(contents, stream=True):
+            try:
+                text = chunk.text
+            except ValueError:  # chunk without text parts (e.g. finish info)
+                continue
+            found = scanner.feed(text)
+            if found is not None:
+                return found
+        return scanner.text
+
+    def _generative_model(self):
+        """Shared GenerativeModel, rebuilt only if `default_model` changed."""
+        if self._model_name != self.default_model:
+            self._model = self._genai.GenerativeModel(self.default_model)
+            self._model_name = self.default_model
+        return self._model
+
+    def _response_cache_key(self, message: str) -> str:
+        """SHA‑256 over everything that influences the Gemini reply."""
+        # The prompt embeds today's date, so relative dates ("next Monday")
+        # must not be served from another day's entry.
+        today = datetime.date.today().isoformat()
+        return hashlib.sha256(
+            b"\x00".join(
+                [
+                    self.default_model.encode(),
+                    PROMPT_VERSION,
+                    today.encode(),
+                    self.language.encode(),
+                    self.location.encode(),
+                    message.encode(),
+                ]
+            )
+        ).hexdigest()
+
+    def _response_cache_get(self, key: str) -> Optional[str]:
+        """Return the cached reply for `key`, or None on miss / bad entry."""
+        if self.cache_dir is None:
+            return None
+        path = self.cache_dir / f"{key}.json"
+        try:
+            entry = _loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable cache entry %s: %s", path.name, exc)
+            return None
+
+        reply = entry.get("reply") if isinstance(entry, dict) else None
+        if not isinstance(reply, str) or _reply_error(reply) is not None:
+            logger.warning("Ignoring malformed cache entry %s.", path.name)
+            return None
+        return reply
+
+    def _response_cache_put(self, key: str, reply: str) -> None:
+        """
+        Store `reply` under `key` (atomic replace, best effort).
+
+        Callers only pass replies that already passed `_reply_error`.
+        """
+        if self.cache_dir is None:
+            return
+        path = self.cache_dir / f"{key}.json"
+        entry = {"reply": reply, "ts": time.time(), "model": self.default_model}
+        # A private temp file per write, so concurrent puts of the same key
+        # (e.g. from `extract_events_batch` threads) never share one.
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.cache_dir,
+                prefix=f"{key}.", suffix=".tmp", delete=False,
+            ) as tmp:
+                tmp_name = tmp.name
+                json.dump(entry, tmp, ensure_ascii=False)
+            os.replace(tmp_name, path)
+        except OSError as exc:
+            logger.warning("Could not write cache entry %s: %s", path.name, exc)
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _report_tz_conversions(data: Dict[str, Any] | None) -> None:
+        """Print every timezone conversion Gemini reported in `data`."""
+        if not data:
+            return
+        for event in data.get("events", []):
+            tz_info = event.get("tz_conversion", "")
+            if tz_info:
+                print(
+                    f'Timezone conversion triggered: "{tz_info}" '
+                    f'in "{event.get("summary", "")}"'
+                )
+
@@ -9,135 +9,341 @@ output of ``API.extract_and_parse_json()``.
 
 from __future__ import annotations
 
+import calendar
 import datetime
-from typing import Any, Dict, List
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Dict, List, Optional
 
-import pytz
-from tzlocal import get_localzone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError  # Python 3.9+
 
 __all__ = ["generate_ics"]
 
+# RFC 5545 §3.3.11 – characters that must be escaped in TEXT values.
+_ESCAPE = str.maketrans({
+    "\\": "\\\\",
+    ";": "\\;",
+    ",": "\\,",
+    "\n": "\\n",
+    "\r": "",
+})
 
-def generate_ics(events: Any, filename: str = "calendar.ics") -> None:
-    """
-    Convert *events* into an ICS file and save it.
+_ICS_HEADER = (
+    b"BEGIN:VCALENDAR\r\n"
+    b"VERSION:2.0\r\n"
+    b"PRODID:-//Custom Calendar//NONSGML v1.0//EN\r\n"
+    b"CALSCALE:GREGORIAN\r\n"
+)
+_ICS_FOOTER = b"END:VCALENDAR\r\n"
 
-    Parameters
-    ----------
-    events : list[dict] | dict
-        Either a list of event dictionaries **or** a dict containing an
-        ``"events"`` field (the raw output from ``API.extract_and_parse_json``).
-    filename : str, default "calendar.ics"
-        Destination file name (overwritten if it exists).
-    """
-    # Accept both list and dict formats ----------------------------------
-    if isinstance(events, dict) and "events" in events:
-        events = events["events"]
+_WRITE_CHUNK = 64  # VEVENTs buffered before each write to disk
 
-    if not isinstance(events, list):
-        raise TypeError("`events` must be a list or a dict with an 'events' key")
+_PARALLEL_CHUNK = 1024  # events per task when `workers` is set
 
-    # --------------------------------------------------------------------
-    ics_content: str = (
-        "BEGIN:VCALENDAR\n"
-        "VERSION:2.0\n"
-        "PRODID:-//Custom Calendar//NONSGML v1.0//EN\n"
-        "CALSCALE:GREGORIAN\n"
-    )
+_FOLD_LIMIT = 75  # max octets per content line (RFC 5545 §3.1)
 
-    local_timezone = get_localzone()
 
-    for event in events:
+def _fold(line: str) -> str:
+    """Fold *line* into CRLF + space continuations of at most 75 octets."""
+    if line.isascii():
+        if len(line) <= _FOLD_LIMIT:
+            return line
+        chunks = [line[:_FOLD_LIMIT]]
+        # Continuation lines start with a space, leaving 74 octets of text.
+        chunks += [line[i:i + _FOLD_LIMIT - 1]
+                   for i in range(_FOLD_LIMIT, len(line), _FOLD_LIMIT - 1)]
+        return "\r\n ".join(chunks)
+
+    # Non‑ASCII: never split inside a multi‑byte UTF‑8 sequence.
+    chunks = []
+    start = size = 0
+    limit = _FOLD_LIMIT
+    for i, ch in enumerate(line):
+        code = ord(ch)
+        width = 1 if code < 0x80 else 2 if code < 0x800 else 3 if code < 0x10000 else 4
+        if size + width > limit:
+            chunks.append(line[start:i])
+            start, size, limit = i, 0, _FOLD_LIMIT - 1
+        size += width
+    chunks.append(line[start:])
+    return "\r\n ".join(chunks)
+
+
+# Date / time shapes accepted in event fields. The prompt asks for
+# YYYY-MM-DD and 24h HH:MM; single‑digit month, day, hour and minute are
+# tolerated too and zero‑padded by the normalizers below.
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{1,2})")
+_POS_INT_RE = re.compile(r"[1-9]\d*")
+
+_RRULE_FREQS = frozenset({"DAILY", "WEEKLY", "MONTHLY"})
+
+# Fields that identify an event for duplicate removal.
+_DEDUPE_FIELDS = (
+    "summary", "start_date", "start_time", "end_date", "end_time",
+    "timezone", "location",
+)
+
+
+_local_tz = None  # memoized by _get_local_tz()
+
+
+def _get_local_tz():
+    """Return the OS time zone, importing ``tzlocal`` only on first use."""
+    global _local_tz
+    if _local_tz is None:
+        from tzlocal import get_localzone  # pip install tzlocal
+
+        _local_tz = get_localzone()
+    return _local_tz
+
+
+# Bulk exports repeat the same handful of dates and times across many
+# events, so the normalizers are memoized per distinct input string.
+@lru_cache(maxsize=4096)
+def _normalize_date(value: str) -> Optional[str]:
+    """Return *value* as ``YYYY-MM-DD``, or None if it is not a valid date."""
+    match = _DATE_RE.fullmatch(value.strip())
+    if not match:
+        return None
+    year, month, day = int(match[1]), int(match[2]), int(match[3])
+    if year < 1 or not 1 <= month <= 12:
+        return None
+    if not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+
+@lru_cache(maxsize=4096)
+def _normalize_time(value: str) -> Optional[str]:
+    """Return *value* as 24h ``HH:MM``, or None if it is not a valid time."""
+    match = _TIME_RE.fullmatch(value.strip())
+    if not match:
+        return None
+    hour, minute = int(match.group(1)), int(match.group(2))
+    if hour > 23 or minute > 59:
+        return None
+    return f"{hour:02d}:{minute:02d}"
+
+
+def _ics_date(date_str: str) -> str:
+    """Normalized ``YYYY-MM-DD`` → ``YYYYMMDD``."""
+    return date_str[:4] + date_str[5:7] + date_str[8:]
+
+
+@lru_cache(maxsize=4096)
+def _ics_next_day(date_str: str) -> str:
+    """``YYYYMMDD`` of the day after normalized *date_str* (all‑day DTEND)."""
+    day = int(date_str[8:])
+    if day < 28:  # every month has a 28th, so no month / year roll‑over
+        return f"{date_str[:4]}{date_str[5:7]}{day + 1:02d}"
+    next_day = datetime.date.fromisoformat(date_str) + datetime.timedelta(days=1)
+    return next_day.strftime("%Y%m%d")
+
+
+def _ics_stamp(date_str: str, time_str: str) -> str:
+    """Local ``YYYYMMDDTHHMMSS`` stamp from normalized date and time."""
+    return f"{_ics_date(date_str)}T{time_str[:2]}{time_str[3:]}00"
+
+
+def _rrule(recurrence: Any) -> Optional[str]:
+    """RRULE line for a ``recurrence`` dict, or None if it is unusable."""
+    if not isinstance(recurrence, dict):
+        return None
+    freq = str(recurrence.get("frequency", "none")).strip().upper()
+    if freq not in _RRULE_FREQS:
+        return None
+
+    interval = str(recurrence.get("interval", 1)).strip()
+    if not _POS_INT_RE.fullmatch(interval):
+        interval = "1"
+    rrule = f"RRULE:FREQ={freq};INTERVAL={interval}"
+
+    count = str(recurrence.get("count") or "").strip()
+    if _POS_INT_RE.fullmatch(count):
+        rrule += f";COUNT={count}"
+    return rrule
+
+
+def _encode_lines(lines: List[str]) -> bytes:
+    """Join content lines with CRLF (RFC 5545) and encode them as UTF‑8."""
+    return ("\r\n".join(lines) + "\r\n").encode("utf-8")
+
+
+def _text_line(name: str, value: Any) -> str:
+    """Build an escaped and folded ``NAME:value`` line for a TEXT property."""
+    text = "" if value is None else str(value)
+    return _fold(f"{name}:{text.translate(_ESCAPE)}")
+
+
+def _render_chunk(chunk: List[Dict], local_tz_key: str) -> bytes:
+    """
+    Render the VEVENT blocks for *chunk* as UTF‑8 encoded, CRLF‑terminated
+    content lines.
+
+    Module level (and free of shared state) so it can also run in a worker
+    process; *local_tz_key* is the zone used for events without one.
+    """
+    parts: List[str] = []
+    known_zones = {local_tz_key}  # zone names already checked by ZoneInfo
+
+    for event in chunk:
         # -------- basic extraction -------------------------------------
         summary: str = event.get("summary", "Unnamed Event")
 
-        start_date: str = event.get("start_date", "none")  # YYYY‑MM‑DD
-        end_date: str = (event.get("end_date") or start_date).strip()
+        start_date: str = str(event.get("start_date", "none")).strip()  # YYYY‑MM‑DD
+        end_date: str = str(event.get("end_date") or start_date).strip()
 
-        start_time: str = (event.get("start_time") or "").strip()  # HH:MM or ""
-        end_time: str = (event.get("end_time") or "").strip()      # HH:MM or ""
+        start_time: str = str(event.get("start_time") or "").strip()  # HH:MM or ""
+        end_time: str = str(event.get("end_time") or "").strip()      # HH:MM or ""
 
-        timezone: str = event.get("timezone", "none")
+        timezone: str = str(event.get("timezone") or "").strip()
         location: str = event.get("location", "")
         description: str = event.get("description", "")
         recurrence: Dict | None = event.get("recurrence")
 
         # -------- validation -------------------------------------------
-        if str(start_date).lower() == "none":
+        if start_date.lower() == "none":
             print(f"Skipping event '{summary}' due to missing start date.")
             continue
 
-        # Default to local zone if none specified -----------------------
-        if str(timezone).lower() == "none":
-            timezone = local_timezone.key
-
-        tz = pytz.timezone(timezone)
-
-        # -------- build datetime objects -------------------------------
-        try:
-            if start_time == "":
-                # All‑day event – DTSTART inclusive, DTEND exclusive -----
-                start_date_obj = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-                end_date_obj = (
-                    datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
-                    + datetime.timedelta(days=1)
-                )
-                is_all_day = True
-            else:
-                # Timed event
-                if not end_time:
-                    end_time = start_time  # default: same time
-
-                start_dt = tz.localize(
-                    datetime.datetime.strptime(f"{start_date} {start_time}", "%Y-%m-%d %H:%M")
-                )
-                end_dt = tz.localize(
-                    datetime.datetime.strptime(f"{end_date} {end_time}", "%Y-%m-%d %H:%M")
-                )
-                is_all_day = False
-        except ValueError as exc:
-            print(f"Skipping event '{summary}' due to invalid date format: {exc}")
+        # Normalize dates / times up front; malformed values are
+        # rejected here by the regexes instead of by raising later.
+        norm_start, norm_end = _normalize_date(start_date), _normalize_date(end_date)
+        if norm_start is None or norm_end is None:
+            bad = start_date if norm_start is None else end_date
+            print(f"Skipping event '{summary}' due to invalid date format: {bad!r}")
             continue
+        start_date, end_date = norm_start, norm_end
+
+        if start_time:
+            if not end_time:
+                end_time = start_time  # default: same time
+            norm_start, norm_end = _normalize_time(start_time), _normalize_time(end_time)
+            if norm_start is None or norm_end is None:
+                bad = start_time if norm_start is None else end_time
+                print(f"Skipping event '{summary}' due to invalid time format: {bad!r}")
+                continue
+            start_time, end_time = norm_start, norm_end
 
         # -------- compose VEVENT block ---------------------------------
-        if is_all_day:
-            ics_event = (
-                "BEGIN:VEVENT\n"
-                f"SUMMARY:{summary}\n"
-                f"DTSTART;VALUE=DATE:{start_date_obj.strftime('%Y%m%d')}\n"
-                f"DTEND;VALUE=DATE:{end_date_obj.strftime('%Y%m%d')}\n"
-                f"LOCATION:{location}\n"
-                f"DESCRIPTION:{description}\n"
-            )
+        # Times are written as local wall‑clock values with a TZID, so no
+        # tz conversion (and no datetime round‑trip) is needed here.
+        if start_time == "":
+            # All‑day event – DTSTART inclusive, DTEND exclusive. DATE
+            # values carry no zone, so the timezone is not looked up.
+            parts.extend([
+                "BEGIN:VEVENT",
+                _text_line("SUMMARY", summary),
+                f"DTSTART;VALUE=DATE:{_ics_date(start_date)}",
+                f"DTEND;VALUE=DATE:{_ics_next_day(end_date)}",
+                _text_line("LOCATION", location),
+                _text_line("DESCRIPTION", description),
+            ])
         else:
-            ics_event = (
-                "BEGIN:VEVENT\n"
-                f"SUMMARY:{summary}\n"
-                f"DTSTART;TZID={timezone}:{start_dt.strftime('%Y%m%dT%H%M%S')}\n"
-                f"DTEND;TZID={timezone}:{end_dt.strftime('%Y%m%dT%H%M%S')}\n"
-                f"LOCATION:{location}\n"
-                f"DESCRIPTION:{description}\n"
-            )
+            # Timed event – default to local zone if none specified
+            if timezone.lower() in ("", "none"):
+                timezone = local_tz_key
+
+            # The tzinfo itself is not needed for the stamps, but the
+            # lookup still rejects unknown zone names before they reach
+            # TZID.
+            if timezone not in known_zones:
+                try:
+                    ZoneInfo(timezone)
+                except (ZoneInfoNotFoundError, ValueError) as exc:
+                    print(f"Skipping event '{summary}' due to unknown timezone: {exc}")
+                    continue
+                known_zones.add(timezone)
+
+            parts.extend([
+                "BEGIN:VEVENT",
+                _text_line("SUMMARY", summary),
+                f"DTSTART;TZID={timezone}:{_ics_stamp(start_date, start_time)}",
+                f"DTEND;TZID={timezone}:{_ics_stamp(end_date, end_time)}",
+                _text_line("LOCATION", location),
+                _text_line("DESCRIPTION", description),
+            ])
 
         # -------- recurrence (optional) --------------------------------
         if recurrence:
-            freq = str(recurrence.get("frequency", "none")).upper()
-            interval = recurrence.get("interval", 1)
-            count = recurrence.get("count")
+            rrule = _rrule(recurrence)
+            if rrule:
+                parts.append(rrule)
+
+        parts.append("END:VEVENT")
+
+    return _encode_lines(parts) if parts else b""
+
+
+def generate_ics(
+    events: Any,
+    filename: str = "calendar.ics",
+    workers: Optional[int] = None,
+) -> None:
+    """
+    Convert *events* into an ICS file and save it.
 
-            if freq in {"DAILY", "WEEKLY", "MONTHLY"}:
-                rrule = f"RRULE:FREQ={freq};INTERVAL={interval}"
-                if count:
-                    rrule += f";COUNT={count}"
-                ics_event += rrule + "\n"
+    Parameters
+    ----------
+    events : list[dict] | dict
+        Either a list of event dictionaries **or** a dict containing an
+        ``"events"`` field (the raw output from ``API.extract_and_parse_json``).
+    filename : str, default "calendar.ics"
+        Destination file name (overwritten if it exists).
+    workers : int | None, default None
+        Opt‑in: render events in this many worker processes
+        (``ProcessPoolExecutor``). Only pays off for very large inputs on
+        multi‑core machines. Where processes start with "spawn" (Windows,
+        macOS) the calling script needs an ``if __name__ == "__main__":``
+        guard.
+    """
+    # Accept both list and dict formats ----------------------------------
+    if isinstance(events, dict) and "events" in events:
+        events = events["events"]
 
-        ics_event += "END:VEVENT\n"
-        ics_content += ics_event
+    if not isinstance(events, list):
+        raise TypeError("`events` must be a list or a dict with an 'events' key")
+
+    # Drop duplicates before any parsing -------------------------------
+    # The prompt asks Gemini to merge repeated events, but it does not
+    # always manage to.
+    seen: set = set()
+    unique: List[Dict] = []
+    for event in events:
+        # str() keeps the key hashable when a field holds a list / dict.
+        key = tuple(str(event.get(field) or "") for field in _DEDUPE_FIELDS)
+        if key not in seen:
+            seen.add(key)
+            unique.append(event)
+    if len(unique) < len(events):
+        print(f"Skipping {len(events) - len(unique)} duplicate event(s).")
+    events = unique
+
+    local_tz_key: str = _get_local_tz().key
 
     # --------------------------------------------------------------------
-    ics_content += "END:VCALENDAR"
+    # Events are rendered in chunks and each chunk is written as soon as it
+    # is ready, so the whole calendar is never held in memory at once.
+    # Chunks are UTF‑8 encoded in one go and written to a binary file, which
+    # also keeps the CRLF line endings untouched on every platform. With
+    # `workers`, chunks are rendered in worker processes; ``map`` keeps the
+    # order.
+    parallel = workers is not None and workers > 1 and len(events) > _PARALLEL_CHUNK
+    size = _PARALLEL_CHUNK if parallel else _WRITE_CHUNK
+    chunks = [events[i:i + size] for i in range(0, len(events), size)]
 
-    with open(filename, "w", encoding="utf-8") as file:
-        file.write(ics_content)
+    with open(filename, "wb") as file:
+        file.write(_ICS_HEADER)
+        if parallel:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for fragment in executor.map(_render_chunk, chunks, repeat(local_tz_key)):
+                    file.write(fragment)
+        else:
+            for chunk in chunks:
+                file.write(_render_chunk(chunk, local_tz_key))
+        file.write(_ICS_FOOTER)
 
     print(f"ICS file saved as {filename}")